@@ -1,15 +1,41 @@
 const axios = require('axios');
+const crypto = require('crypto');
 const SR_SERVICE_URL = 'http://localhost:5001/fit';
 
+// Memoize successful fits: identical data + function set always yields the same request.
+// Map keeps insertion order, so the first key is the least recently used.
+const CACHE_SIZE = 256;
+const fitCache = new Map();
+
+const cacheKey = (cleanData, functionSet) => crypto
+    .createHash('blake2b512')
+    .update(JSON.stringify(cleanData))
+    .update('\0')
+    .update(functionSet.join(','))
+    .digest('hex');
+
 const runGPEngine = async (cleanData, functionSet) => {
+    const key = cacheKey(cleanData, functionSet);
+    if (fitCache.has(key)) {
+        const cached = fitCache.get(key);
+        fitCache.delete(key);
+        fitCache.set(key, cached);
+        console.log(`♻️ Cache hit for: [${functionSet.join(', ')}]`);
+        return { ...cached };
+    }
+
     try {
         console.log(`🔬 Spawning Python with: [${functionSet.join(', ')}]`);
-        const response = await axios.post(SR_SERVICE_URL, { 
-            data: cleanData, 
+        const response = await axios.post(SR_SERVICE_URL, {
+            data: cleanData,
             output_column: 'y', // We send normalized column name 'y'
-            function_set: functionSet 
+            function_set: functionSet
         }, { timeout: 120000 }); // 2 min timeout
 
+        if (!response.data.error) {
+            fitCache.set(key, response.data);
+            if (fitCache.size > CACHE_SIZE) fitCache.delete(fitCache.keys().next().value);
+        }
         return response.data;
     } catch (error) {
         // Return a safe error object instead of crashing
@@ -24,4 +50,4 @@ const runGPEngine = async (cleanData, functionSet) => {
     }
 };
 
-module.exports = { runGPEngine };
\ No newline at end of file
+module.exports = { runGPEngine };